@@ -42,7 +42,17 @@ if __name__ == "__main__":
     # for some reason model merge takes really long to launch, but we need to make sure it goes online before the orchestrator starts
     try:
         # Run the main orchestrator
-        uvicorn.run(app, host=settings.ORCHESTRATOR_HOST, port=settings.ORCHESTRATOR_PORT)
+        # Orchestrator state lives in this process, so it runs a single worker. "auto" picks uvloop and
+        # httptools when they are installed (uvicorn[standard], orchestrator group) and falls back otherwise
+        uvicorn.run(
+            app,
+            host=settings.ORCHESTRATOR_HOST,
+            port=settings.ORCHESTRATOR_PORT,
+            loop="auto",
+            http="auto",
+            backlog=settings.ORCHESTRATOR_BACKLOG,
+            timeout_keep_alive=settings.ORCHESTRATOR_KEEP_ALIVE_TIMEOUT,
+        )
     except Exception as e:
         logger.exception(f"Error starting orchestrator: {e}")
         raise e
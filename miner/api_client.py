@@ -20,7 +20,7 @@ from orchestrator.serializers import (
     LossReportResponse,
     MinerRegistrationResponse,
 )
-from utils.partitions import Partition
+from utils.partitions import PARTITION_LIST_ADAPTER, Partition
 
 
 class APIClient:
@@ -347,7 +347,7 @@ class APIClient:
         response = await self._make_request(
             "post",
             f"{self.base_url}/orchestrator/miners/notify_merged_partitions_uploaded",
-            json=[partition.model_dump() for partition in partitions],
+            json=PARTITION_LIST_ADAPTER.dump_python(partitions, mode="json"),
         )
         logger.info("✅ API: Merged partitions notification sent")
         return response
@@ -1,26 +1,29 @@
 import time
 import settings
-from typing import Annotated, Optional
+from typing import Optional
 
 from loguru import logger
-from fastapi import APIRouter, HTTPException, Header, FastAPI, Request
+from fastapi import APIRouter, Depends, HTTPException, FastAPI, Request
+from fastapi.responses import Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from utils.bt_utils import verify_entity_type
-from utils.epistula import EpistulaHeaders, create_message_body
+from utils.epistula import EMPTY_BODY, EMPTY_BODY_HASH, EpistulaHeaders, create_message_body, get_epistula_headers
 
 from orchestrator.orchestrator import orchestrator
-from utils.partitions import Partition
-from uuid import uuid4
+from utils.partitions import PARTITION_LIST_ADAPTER, Partition
+from utils.uuid_pool import next_uuid
 
 from orchestrator.serializers import (
     AllLossesResponse,
     LayerAssignmentResponse,
     LossReportRequest,
     LossReportResponse,
+    MergingStatusResponse,
     MinerRegistrationResponse,
     MinerStatusUpdate,
     SubmittedWeights,
+    dump_loss_report_response,
 )
 
 
@@ -50,8 +53,16 @@ def get_remote_address(request: Request) -> str:
 app = FastAPI()
 
 # Initialize rate limiter
-hotkey_limiter = Limiter(key_func=get_signed_by_key)
-ip_limiter = Limiter(key_func=get_remote_address)
+hotkey_limiter = Limiter(
+    key_func=get_signed_by_key,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    storage_options=settings.RATE_LIMIT_STORAGE_OPTIONS,
+)
+ip_limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    storage_options=settings.RATE_LIMIT_STORAGE_OPTIONS,
+)
 
 # Add rate limit exception handler to app
 app.state.hotkey_limiter = hotkey_limiter
@@ -60,6 +71,9 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 router = APIRouter(prefix="/orchestrator")
 
+# Static body for load balancer health probes, encoded once at import
+HEALTHY_RESPONSE_BODY = b'{"status":"healthy"}'
+
 
 # Load in the initialized state of the orchestrator
 
@@ -75,19 +89,9 @@ async def get_global_miner_weights(request: Request):  # Required for rate limit
 async def submit_miner_weights(
     request: Request,  # Required for rate limiting
     weights: dict[str, float],
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
-    headers = EpistulaHeaders(
-        version=version,
-        timestamp=timestamp,
-        uuid=uuid,
-        signed_by=signed_by,
-        request_signature=request_signature,
-    )
+    signed_by = headers.signed_by
     error = headers.verify_signature_v2(create_message_body(weights), time.time())
     if error:
         raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
@@ -104,27 +108,18 @@ async def submit_miner_weights(
 @hotkey_limiter.limit(settings.HOTKEY_LIMIT)
 async def register_miner(
     request: Request,  # Required for rate limiting
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
+    signed_by = headers.signed_by
+    short_hotkey = signed_by[:8]
     with logger.contextualize(
         activation_uid=None,
         layer=None,
         hotkey=signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
         try:
-            error = headers.verify_signature_v2(create_message_body({}), time.time())
+            error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
             if error:
                 raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
@@ -138,7 +133,7 @@ async def register_miner(
                     required_type="miner",
                 )
 
-            logger.info(f"Received registration request from {signed_by[:8]}")
+            logger.info(f"Received registration request from {short_hotkey}")
 
             if signed_by in miner_entities:
                 logger.error(f"Miner {signed_by} already registered")
@@ -149,7 +144,7 @@ async def register_miner(
                 raise HTTPException(status_code=409, detail="Failed to register miner")
             return MinerRegistrationResponse(hotkey=signed_by, layer=layer)
         except Exception as e:
-            logger.error(f"Failed to register miner {signed_by[:8]}: {str(e)}")
+            logger.error(f"Failed to register miner {short_hotkey}: {str(e)}")
             raise HTTPException(status_code=409, detail="Failed to register miner") from e
 
 
@@ -158,91 +153,71 @@ async def register_miner(
 async def update_miner_status(
     request: Request,  # Required for rate limiting
     status_update: MinerStatusUpdate,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
-    with logger.contextualize(
-        activation_uid=None,
-        layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
-        hotkey=signed_by,
-        request_id=str(uuid4()),
-    ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
+    signed_by = headers.signed_by
+    with logger.contextualize(hotkey=signed_by, request_id=next_uuid()):
         error = headers.verify_signature_v2(create_message_body(status_update.model_dump()), time.time())
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-        if settings.BITTENSOR:
-            # Verify the entity is a miner and matches the UID
-            verify_entity_type(signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner")
-
-        try:
-            await orchestrator.update_status(
-                hotkey=signed_by,
-                status=status_update.status,
-                activation_uid=status_update.activation_uid,
-                activation_path=status_update.activation_path,
-            )
-            return {"message": "Status updated successfully"}
-        except IndexError:
-            raise HTTPException(status_code=404, detail="Miner not found")
+        miner_data = orchestrator.miner_registry.get_miner_data(signed_by)
+        with logger.contextualize(
+            activation_uid=None,
+            layer=miner_data.layer,
+        ):
+            if settings.BITTENSOR:
+                # Verify the entity is a miner and matches the UID
+                verify_entity_type(signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner")
+
+            try:
+                await orchestrator.update_status(
+                    hotkey=signed_by,
+                    status=status_update.status,
+                    activation_uid=status_update.activation_uid,
+                    activation_path=status_update.activation_path,
+                )
+                return {"message": "Status updated successfully"}
+            except IndexError:
+                raise HTTPException(status_code=404, detail="Miner not found")
 
 
 @router.post("/miners/request_layer", response_model=LayerAssignmentResponse)
 @hotkey_limiter.limit(settings.HOTKEY_LIMIT)
 async def request_layer(
     request: Request,  # Required for rate limiting
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
-    with logger.contextualize(
-        activation_uid=None,
-        layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
-        hotkey=signed_by,
-        request_id=str(uuid4()),
-    ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
-        error = headers.verify_signature_v2(create_message_body({}), time.time())
+    signed_by = headers.signed_by
+    with logger.contextualize(hotkey=signed_by, request_id=next_uuid()):
+        error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-        if settings.BITTENSOR:
-            # Verify the entity is a miner and matches the UID
-            entity_info = verify_entity_type(
-                signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner"
-            )
+        miner_data = orchestrator.miner_registry.get_miner_data(signed_by)
+        with logger.contextualize(
+            activation_uid=None,
+            layer=miner_data.layer,
+        ):
+            if settings.BITTENSOR:
+                # Verify the entity is a miner and matches the UID
+                entity_info = verify_entity_type(
+                    signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner"
+                )
 
-            logger.info(f"Miner {entity_info['uid']} ({signed_by[:8]}...) requesting layer")
+                logger.info(f"Miner {entity_info['uid']} ({signed_by[:8]}...) requesting layer")
 
-        try:
-            layer = await orchestrator.request_layer()
-            return LayerAssignmentResponse(layer=layer)
-        except IndexError:
-            raise HTTPException(status_code=404, detail="Miner not found")
+            try:
+                layer = await orchestrator.request_layer()
+                return LayerAssignmentResponse(layer=layer)
+            except IndexError:
+                raise HTTPException(status_code=404, detail="Miner not found")
 
 
-@router.get("/healthcheck")
+@router.get("/healthcheck", response_class=Response)
 @ip_limiter.limit(settings.IP_LIMIT)
 async def healthcheck(request: Request):  # Required for rate limiting
-    return {"status": "healthy"}
+    return Response(content=HEALTHY_RESPONSE_BODY, media_type="application/json")
 
 
 @router.post("/miners/notify_weights_uploaded")
@@ -253,52 +228,43 @@ async def notify_weights_uploaded(
     metadata_path: str,
     optimizer_state_path: str,
     optimizer_state_metadata_path: str,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
-    with logger.contextualize(
-        activation_uid=None,
-        layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
-        hotkey=signed_by,
-        request_id=str(uuid4()),
-        weights_path=weights_path,
-        metadata_path=metadata_path,
-        optimizer_state_path=optimizer_state_path,
-        optimizer_state_metadata_path=optimizer_state_metadata_path,
-    ):
-        hotkey = signed_by
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
-        error = headers.verify_signature_v2(create_message_body({}), time.time())
+    signed_by = headers.signed_by
+    with logger.contextualize(hotkey=signed_by, request_id=next_uuid()):
+        error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-        if settings.BITTENSOR:
-            # Verify the entity is a miner and matches the UID
-            verify_entity_type(signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner")
+        miner_data = orchestrator.miner_registry.get_miner_data(signed_by)
+        with logger.contextualize(
+            activation_uid=None,
+            layer=miner_data.layer,
+            weights_path=weights_path,
+            metadata_path=metadata_path,
+            optimizer_state_path=optimizer_state_path,
+            optimizer_state_metadata_path=optimizer_state_metadata_path,
+        ):
+            hotkey = signed_by
 
-        try:
-            success = await orchestrator.notify_weights_uploaded(
-                hotkey=hotkey,
-                weights_path=weights_path,
-                metadata_path=metadata_path,
-                optimizer_state_path=optimizer_state_path,
-                optimizer_state_metadata_path=optimizer_state_metadata_path,
-            )
-            return {
-                "message": "Weights notification processed successfully",
-                "success": success,
-            }
-        except IndexError:
-            raise HTTPException(status_code=404, detail="Miner not found")
+            if settings.BITTENSOR:
+                # Verify the entity is a miner and matches the UID
+                verify_entity_type(signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner")
+
+            try:
+                success = await orchestrator.notify_weights_uploaded(
+                    hotkey=hotkey,
+                    weights_path=weights_path,
+                    metadata_path=metadata_path,
+                    optimizer_state_path=optimizer_state_path,
+                    optimizer_state_metadata_path=optimizer_state_metadata_path,
+                )
+                return {
+                    "message": "Weights notification processed successfully",
+                    "success": success,
+                }
+            except IndexError:
+                raise HTTPException(status_code=404, detail="Miner not found")
 
 
 @router.post("/miners/notify_merged_partitions_uploaded")
@@ -306,40 +272,33 @@ async def notify_weights_uploaded(
 async def notify_merged_partitions_uploaded(
     request: Request,  # Required for rate limiting
     partitions: list[Partition],
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
-    with logger.contextualize(
-        activation_uid=None,
-        layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
-        hotkey=signed_by,
-        request_id=str(uuid4()),
-        partitions=partitions,
-    ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
-
-        body = [p.model_dump() for p in partitions]
+    signed_by = headers.signed_by
+    body = PARTITION_LIST_ADAPTER.dump_python(partitions, mode="json")
+    with logger.contextualize(hotkey=signed_by, request_id=next_uuid()):
         error = headers.verify_signature_v2(create_message_body(body), time.time())
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-        await orchestrator.notify_merged_partitions_uploaded(hotkey=signed_by, partitions=partitions)
-        return {"message": "Merged partitions notification processed successfully"}
+        miner_data = orchestrator.miner_registry.get_miner_data(signed_by)
+        with logger.contextualize(
+            activation_uid=None,
+            layer=miner_data.layer,
+            partitions=partitions,
+        ):
+            await orchestrator.notify_merged_partitions_uploaded(hotkey=signed_by, partitions=partitions)
+            return {"message": "Merged partitions notification processed successfully"}
 
 
 @router.get("/losses", response_model=AllLossesResponse)
 @ip_limiter.limit("15/minute")
 async def get_all_losses(request: Request):  # Required for rate limiting
-    return AllLossesResponse(losses={str(k): v for k, v in orchestrator.losses.items()})
+    # Skip re-validating every LossReport and serialize the existing models directly in pydantic-core
+    return Response(
+        content=AllLossesResponse.model_construct(losses=orchestrator.losses).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.post("/miners/report_loss", response_model=LossReportResponse)
@@ -347,93 +306,79 @@ async def get_all_losses(request: Request):  # Required for rate limiting
 async def report_loss(
     request: Request,  # Required for rate limiting
     loss_report: LossReportRequest,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
-    with logger.contextualize(
-        activation_uid=loss_report.activation_uid,
-        layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
-        hotkey=signed_by,
-        request_id=str(uuid4()),
-        loss=loss_report.loss_value,
-    ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
-
-        error = headers.verify_signature_v2(create_message_body(loss_report.model_dump()), time.time())
+    signed_by = headers.signed_by
+    # Read the clock once and share it between signature freshness, the stored report and the response
+    now = time.time()
+    with logger.contextualize(hotkey=signed_by, request_id=next_uuid()):
+        error = headers.verify_signature_v2(create_message_body(loss_report.model_dump()), now)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-        if settings.BITTENSOR:
-            # Verify the entity is a miner and matches the UID
-            verify_entity_type(signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner")
-
-        try:
-            await orchestrator.record_and_report_loss(
-                hotkey=signed_by,
-                activation_uid=loss_report.activation_uid,
-                loss=loss_report.loss_value,
-            )
-            return LossReportResponse(
-                hotkey=signed_by,
-                activation_uid=loss_report.activation_uid,
-                loss_value=loss_report.loss_value,
-                timestamp=time.time(),
-            )
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e)) from e
+        miner_data = orchestrator.miner_registry.get_miner_data(signed_by)
+        with logger.contextualize(
+            activation_uid=loss_report.activation_uid,
+            layer=miner_data.layer,
+            loss=loss_report.loss_value,
+        ):
+            if settings.BITTENSOR:
+                # Verify the entity is a miner and matches the UID
+                verify_entity_type(signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner")
+
+            try:
+                await orchestrator.record_and_report_loss(
+                    hotkey=signed_by,
+                    activation_uid=loss_report.activation_uid,
+                    loss=loss_report.loss_value,
+                    timestamp=now,
+                )
+                return Response(
+                    content=dump_loss_report_response(
+                        hotkey=signed_by,
+                        activation_uid=loss_report.activation_uid,
+                        loss_value=loss_report.loss_value,
+                        timestamp=now,
+                    ),
+                    media_type="application/json",
+                )
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@router.get("/is_merging")
+@router.get("/is_merging", response_model=MergingStatusResponse)
 @ip_limiter.limit(settings.IP_LIMIT)
 async def is_merging(request: Request, layer: int):  # Required for rate limiting
     """Check if the system is currently in merging phase."""
     # Public endpoint, no authentication required
     merging_phase, num_sections = await orchestrator.is_merging(layer=layer)
-    return {"status": merging_phase, "num_sections": num_sections}
+    # Returning the response model lets pydantic-core serialize it instead of jsonable_encoder
+    return MergingStatusResponse.model_construct(status=merging_phase, num_sections=num_sections)
 
 
 @router.get("/get_chunks_for_miner", response_model=tuple[list[SubmittedWeights], list[int]])
 @hotkey_limiter.limit(settings.HOTKEY_LIMIT)
 async def get_chunks_for_miner(
     request: Request,  # Required for rate limiting
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ) -> tuple[list[SubmittedWeights], list[int]]:
     """Get the chunks for a miner - this is a list of strings, each representing a chunk."""
-    with logger.contextualize(
-        activation_uid=None,
-        layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
-        hotkey=signed_by,
-        request_id=str(uuid4()),
-    ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
-        error = headers.verify_signature_v2(create_message_body({}), time.time())
+    signed_by = headers.signed_by
+    with logger.contextualize(hotkey=signed_by, request_id=next_uuid()):
+        error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-        if settings.BITTENSOR:
-            # Verify the entity is a miner
-            verify_entity_type(signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner")
+        miner_data = orchestrator.miner_registry.get_miner_data(signed_by)
+        with logger.contextualize(
+            activation_uid=None,
+            layer=miner_data.layer,
+        ):
+            if settings.BITTENSOR:
+                # Verify the entity is a miner
+                verify_entity_type(signed_by=signed_by, metagraph=orchestrator.metagraph, required_type="miner")
 
-        return await orchestrator.get_chunks_for_miner(hotkey=signed_by)
+            return await orchestrator.get_chunks_for_miner(hotkey=signed_by)
 
 
 @router.post("/register_validator")
@@ -442,23 +387,12 @@ async def register_validator(
     request: Request,  # Required for rate limiting
     host: str,
     port: int,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     scheme: str = "http",
 ):
     """Register a validator with the orchestrator."""
-    headers = EpistulaHeaders(
-        version=version,
-        timestamp=timestamp,
-        uuid=uuid,
-        signed_by=signed_by,
-        request_signature=request_signature,
-    )
-
-    error = headers.verify_signature_v2(create_message_body({}), time.time())
+    signed_by = headers.signed_by
+    error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
     if error:
         raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
@@ -529,39 +463,24 @@ async def get_merge_performance_history(
         # Get merge statistics for all layers over the time window
         time_window_seconds = time_window_hours * 3600
 
-        # Overall statistics
-        overall_stats = orchestrator.weight_merging_metrics_collector.get_merge_statistics(
-            layer=None, time_window_seconds=time_window_seconds
-        )
-
-        # Layer-specific statistics if requested
+        # Layer-specific statistics if requested, computed with the overall ones in a single pass over the sessions
         layer_stats = {}
         if include_layer_breakdown:
-            for layer in range(orchestrator.N_LAYERS):
-                layer_stats[layer] = orchestrator.weight_merging_metrics_collector.get_merge_statistics(
-                    layer=layer, time_window_seconds=time_window_seconds
-                )
+            merge_stats = orchestrator.weight_merging_metrics_collector.get_merge_statistics_all_layers(
+                time_window_seconds=time_window_seconds
+            )
+            overall_stats = merge_stats.get(None, {})
+            layer_stats = {layer: merge_stats.get(layer, {}) for layer in range(orchestrator.N_LAYERS)}
+        else:
+            overall_stats = orchestrator.weight_merging_metrics_collector.get_merge_statistics(
+                layer=None, time_window_seconds=time_window_seconds
+            )
 
         # Active sessions info
         active_sessions = orchestrator.get_active_merge_sessions()
 
         # Recent completed sessions (last 10)
-        recent_sessions = []
-        for session in orchestrator.weight_merging_metrics_collector.completed_sessions[-10:]:
-            recent_sessions.append(
-                {
-                    "session_id": session.session_id,
-                    "layer": session.layer,
-                    "status": session.status,
-                    "started_at": session.started_at,
-                    "completed_at": session.completed_at,
-                    "duration": session.get_session_duration(),
-                    "participation_rate": session.get_participation_rate(),
-                    "target_miners_count": len(session.target_miners),
-                    "weights_received_count": len(session.weights_received),
-                    "partitions_completed_count": len(session.partitions_completed),
-                }
-            )
+        recent_sessions = orchestrator.weight_merging_metrics_collector.get_recent_sessions(limit=10)
 
         return {
             "time_window_hours": time_window_hours,
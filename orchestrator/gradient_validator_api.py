@@ -1,13 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, Header
+from fastapi import APIRouter, HTTPException, Depends, Request
 from loguru import logger
-from typing import Dict, Optional, Literal, Annotated
+from typing import Dict, Optional, Literal
 import torch
 import time
 import settings
 from pydantic import BaseModel
 from orchestrator.serializers import GradientValidationResponse
 from gradient_validator.gradient_validator import GradientValidator
-from utils.epistula import EpistulaHeaders, create_message_body
+from utils.epistula import EMPTY_BODY, EMPTY_BODY_HASH, EpistulaHeaders, create_message_body, get_epistula_headers
 
 router = APIRouter(prefix="/gradient-validator")
 
@@ -39,26 +39,15 @@ def verify_whitelisted(signed_by: str):
 @router.post("/initialize", response_model=Dict[str, str])
 async def initialize_validator(
     request: InitializeValidatorRequest,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     validator: GradientValidator = Depends(get_validator),
 ):
     """Initialize the gradient validator to track a specific miner and layer."""
-    headers = EpistulaHeaders(
-        version=version,
-        timestamp=timestamp,
-        uuid=uuid,
-        signed_by=signed_by,
-        request_signature=request_signature,
-    )
     error = headers.verify_signature_v2(create_message_body(request.model_dump()), time.time())
     if error:
         raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-    verify_whitelisted(signed_by)
+    verify_whitelisted(headers.signed_by)
 
     try:
         logger.info(f"Initializing gradient validator for miner {request.miner_hotkey} and layer {request.layer}")
@@ -83,26 +72,15 @@ async def initialize_validator(
 async def forward_activation(
     activation_uid: str,
     direction: Literal["forward", "backward", "initial"],
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     validator: GradientValidator = Depends(get_validator),
 ):
     """Perform a forward pass with the gradient validator."""
-    headers = EpistulaHeaders(
-        version=version,
-        timestamp=timestamp,
-        uuid=uuid,
-        signed_by=signed_by,
-        request_signature=request_signature,
-    )
-    error = headers.verify_signature_v2(create_message_body({}), time.time())
+    error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
     if error:
         raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-    verify_whitelisted(signed_by)
+    verify_whitelisted(headers.signed_by)
 
     try:
         is_valid, score, reason = await validator.forward(activation_uid=activation_uid, direction=direction)
@@ -117,26 +95,15 @@ async def forward_activation(
 @router.post("/backward", response_model=GradientValidationResponse)
 async def backward_activation(
     activation_uid: str,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     validator: GradientValidator = Depends(get_validator),
 ):
     """Perform a backward pass with the gradient validator."""
-    headers = EpistulaHeaders(
-        version=version,
-        timestamp=timestamp,
-        uuid=uuid,
-        signed_by=signed_by,
-        request_signature=request_signature,
-    )
-    error = headers.verify_signature_v2(create_message_body({}), time.time())
+    error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
     if error:
         raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-    verify_whitelisted(signed_by)
+    verify_whitelisted(headers.signed_by)
 
     try:
         is_valid, score, reason = await validator.backward(activation_uid=activation_uid)
@@ -153,26 +120,15 @@ async def validate_weights(
     weights_path: str,
     metadata_path: str,
     optimizer_state_path: str,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     validator: GradientValidator = Depends(get_validator),
 ):
     """Validate the weights submitted by a miner."""
-    headers = EpistulaHeaders(
-        version=version,
-        timestamp=timestamp,
-        uuid=uuid,
-        signed_by=signed_by,
-        request_signature=request_signature,
-    )
-    error = headers.verify_signature_v2(create_message_body({}), time.time())
+    error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
     if error:
         raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
-    verify_whitelisted(signed_by)
+    verify_whitelisted(headers.signed_by)
 
     try:
         is_valid, score, reason = await validator.validate_weights(
@@ -1,6 +1,7 @@
 import time
 import settings
 from collections import defaultdict
+from operator import attrgetter
 from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
@@ -746,6 +747,21 @@ class WeightMergingSession(BaseModel):
         return participated / len(self.target_miners)
 
 
+RECENT_SESSION_KEYS = (
+    "session_id",
+    "layer",
+    "status",
+    "started_at",
+    "completed_at",
+    "duration",
+    "participation_rate",
+    "target_miners_count",
+    "weights_received_count",
+    "partitions_completed_count",
+)
+_recent_session_fields = attrgetter("session_id", "layer", "status", "started_at", "completed_at")
+
+
 class WeightMergingMetricsCollector(BaseModel):
     """Collector for managing weight merging metrics."""
 
@@ -845,6 +861,30 @@ class WeightMergingMetricsCollector(BaseModel):
                 continue
             relevant_sessions.append(session)
 
+        return self._summarize_sessions(relevant_sessions)
+
+    def get_merge_statistics_all_layers(
+        self, time_window_seconds: Optional[float] = None
+    ) -> Dict[Optional[int], Dict[str, Any]]:
+        """Get merge statistics for every layer in a single pass over the completed sessions.
+
+        Returns a dict keyed by layer, with the statistics across all layers under the `None` key.
+        Layers without sessions in the time window are omitted.
+        """
+        current_time = time.time()
+
+        sessions_by_layer: Dict[Optional[int], List[WeightMergingSession]] = defaultdict(list)
+        for session in self.completed_sessions:
+            if time_window_seconds is not None and (current_time - session.started_at) > time_window_seconds:
+                continue
+            sessions_by_layer[None].append(session)
+            sessions_by_layer[session.layer].append(session)
+
+        return {layer: self._summarize_sessions(sessions) for layer, sessions in sessions_by_layer.items()}
+
+    @staticmethod
+    def _summarize_sessions(relevant_sessions: List[WeightMergingSession]) -> Dict[str, Any]:
+        """Calculate merge statistics over a set of sessions."""
         if not relevant_sessions:
             return {}
 
@@ -876,6 +916,28 @@ class WeightMergingMetricsCollector(BaseModel):
             "sample_count": total_sessions,
         }
 
+    def get_recent_sessions(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get a summary of the most recently completed merge sessions."""
+        # completed_sessions[-0:] would be the whole history rather than nothing
+        if limit <= 0:
+            return []
+        return [
+            dict(
+                zip(
+                    RECENT_SESSION_KEYS,
+                    _recent_session_fields(session)
+                    + (
+                        session.get_session_duration(),
+                        session.get_participation_rate(),
+                        len(session.target_miners),
+                        len(session.weights_received),
+                        len(session.partitions_completed),
+                    ),
+                )
+            )
+            for session in self.completed_sessions[-limit:]
+        ]
+
     def get_miner_merge_performance(
         self, miner_hotkey: str, time_window_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
@@ -67,7 +67,7 @@ class Orchestrator(BaseModel):
     )
     time_series_collector: TimeSeriesMetricsCollector = Field(default_factory=TimeSeriesMetricsCollector)
     miner_scores: dict[int, list[float]] = Field(default_factory=dict)
-    losses: dict[int, list[LossReport]] = Field(default_factory=lambda: defaultdict(list))
+    losses: dict[str, list[LossReport]] = Field(default_factory=lambda: defaultdict(list))
     TIMEOUT: int = settings.TIMEOUT
     total_forwards: int = 0
     total_backwards: int = 0
@@ -197,7 +197,8 @@ class Orchestrator(BaseModel):
 
         Return the layer assigned to the miner.
         """
-        logger.debug(f"Attempting to register miner {hotkey[:8]}...")
+        short_hotkey = hotkey[:8]
+        logger.debug(f"Attempting to register miner {short_hotkey}...")
 
         # Handle BITTENSOR mode
         if settings.BITTENSOR:
@@ -206,7 +207,7 @@ class Orchestrator(BaseModel):
                 return
 
             if hotkey not in self.metagraph.hotkeys:
-                logger.warning(f"Miner {hotkey[:8]} not found in metagraph")
+                logger.warning(f"Miner {short_hotkey} not found in metagraph")
                 return
 
             # Get the uid of the miner
@@ -216,7 +217,7 @@ class Orchestrator(BaseModel):
 
         # Check if miner is already registered
         if hotkey in self.miner_registry.get_all_miner_data().keys():
-            logger.info(f"Miner {hotkey[:8]} already registered, returning already assigned layer")
+            logger.info(f"Miner {short_hotkey} already registered, returning already assigned layer")
             return self.miner_registry.get_miner_data(miner_hotkey=hotkey).layer
 
         try:
@@ -224,16 +225,16 @@ class Orchestrator(BaseModel):
             layer = await self.request_layer()
             self.miner_registry.add_miner_to_registry(miner_hotkey=hotkey, layer=layer, uid=uid)
 
-            logger.info(f"Successfully registered miner {hotkey[:8]} (Layer: {layer})")
+            logger.info(f"Successfully registered miner {short_hotkey} (Layer: {layer})")
 
             # Report new miner registration to dashboard immediately
             if settings.ENABLE_DASHBOARD_REPORTING:
                 await self.update_dashboard(miner_hotkey=hotkey)
                 if settings.DASHBOARD_LOGS:
-                    logger.info(f"Reported first-time registration of miner {hotkey[:8]} to dashboard")
+                    logger.info(f"Reported first-time registration of miner {short_hotkey} to dashboard")
 
         except Exception as e:
-            logger.error(f"Failed to register miner {hotkey[:8]}: {str(e)}")
+            logger.error(f"Failed to register miner {short_hotkey}: {str(e)}")
             return None
 
         return layer
@@ -638,7 +639,9 @@ class Orchestrator(BaseModel):
         """
         return self.merging_phases[layer].stage, await self.get_partition_count(layer)
 
-    async def record_and_report_loss(self, hotkey: str, activation_uid: str, loss: float):
+    async def record_and_report_loss(
+        self, hotkey: str, activation_uid: str, loss: float, timestamp: Optional[float] = None
+    ):
         await self._ensure_dashboard_initialized()
         """
         Record and report a loss value from a miner.
@@ -651,13 +654,14 @@ class Orchestrator(BaseModel):
             miner_uid: The ID of the miner reporting the loss
             activation_uid: The activation ID associated with this loss
             loss: The loss value
+            timestamp: When the loss was reported, defaults to now
         """
         # Create loss report for internal tracking
         loss_report = LossReport(
             hotkey=hotkey,
             activation_uid=activation_uid,
             loss_value=loss,
-            timestamp=time.time(),
+            timestamp=timestamp if timestamp is not None else time.time(),
         )
         self.losses[hotkey].append(loss_report)
         if settings.DASHBOARD_LOGS:
@@ -1,7 +1,10 @@
 from typing import Any, Dict, List, Literal
 
+import orjson
 from pydantic import BaseModel
 
+from utils.shared_states import MergingPhase
+
 
 class SubmittedWeights(BaseModel):
     weights_path: str
@@ -30,6 +33,11 @@ class LayerAssignmentResponse(BaseModel):
     message: str = "Layer assigned successfully"
 
 
+class MergingStatusResponse(BaseModel):
+    status: MergingPhase
+    num_sections: int | float
+
+
 class LossReportRequest(BaseModel):
     activation_uid: str
     loss_value: float
@@ -46,6 +54,25 @@ class LossReportResponse(LossReport):
     message: str = "Loss reported successfully"
 
 
+# LossReportResponse serialized field by field for the report_loss hot path; each %s slot takes an
+# orjson-encoded value. Any change to the model's fields must be mirrored here.
+LOSS_REPORT_RESPONSE_TEMPLATE = (
+    b'{"hotkey":%s,"activation_uid":%s,"loss_value":%s,"timestamp":%s,"message":'
+    + orjson.dumps(LossReportResponse.model_fields["message"].default)
+    + b"}"
+)
+
+
+def dump_loss_report_response(hotkey: str, activation_uid: str, loss_value: float, timestamp: float) -> bytes:
+    """JSON-encode a LossReportResponse without building the model."""
+    return LOSS_REPORT_RESPONSE_TEMPLATE % (
+        orjson.dumps(hotkey),
+        orjson.dumps(activation_uid),
+        orjson.dumps(loss_value),
+        orjson.dumps(timestamp),
+    )
+
+
 class MinerLossesResponse(BaseModel):
     losses: List[LossReport]
 
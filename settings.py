@@ -83,6 +83,8 @@ ORCHESTRATOR_PORT = int(os.getenv("ORCHESTRATOR_PORT", 8000))
 ORCHESTRATOR_HOST = os.getenv("ORCHESTRATOR_HOST", "localhost")
 ORCHESTRATOR_SCHEME = os.getenv("ORCHESTRATOR_SCHEME", "http")
 ORCHESTRATOR_URL = f"{ORCHESTRATOR_SCHEME}://{ORCHESTRATOR_HOST}:{ORCHESTRATOR_PORT}"
+ORCHESTRATOR_BACKLOG = int(os.getenv("ORCHESTRATOR_BACKLOG", 4096))
+ORCHESTRATOR_KEEP_ALIVE_TIMEOUT = int(os.getenv("ORCHESTRATOR_KEEP_ALIVE_TIMEOUT", 75))  # seconds
 
 # S3
 S3_BUCKET = os.getenv("S3_BUCKET")
@@ -91,6 +93,8 @@ USE_S3 = os.getenv("USE_S3", True)  # always use it if not specified
 
 # Epistula
 SIGNATURE_TIMEOUT_MS = 10000
+SIGNATURE_CACHE_SIZE = 4096
+SIGNATURE_CACHE_TTL = 300  # seconds
 
 # Gradient Validators
 VALIDATE = os.getenv("VALIDATE") == "True"
@@ -141,7 +145,7 @@ wallet_hotkey = os.getenv("wallet_hotkey", "m1")
 MINER_HOTKEYS_ENV = os.getenv("MINER_HOTKEYS")
 MINER_HOTKEYS = MINER_HOTKEYS_ENV.strip().split(",") if MINER_HOTKEYS_ENV is not None else [wallet_hotkey]
 netuid = int(os.getenv("netuid", "9"))
-__spec_version__ = 4065
+__spec_version__ = 4066
 
 # Weights & Biases
 WANDB_PROJECT = "pretrain-test"
@@ -178,6 +182,10 @@ LOCAL_OPTIMIZER_STEPS = 2 if MOCK else 10
 GLOBAL_OPTIMIZER_STEPS = 2 if MOCK else 10
 BURN_FACTOR = 1.25  # 1-1/BurnFactor % is burned, for 5 it's 80%
 
+# Rate limiting. Use a shared backend such as "redis://host:6379" so that limits are enforced across
+# uvicorn workers; the default in-memory storage is per-process.
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+RATE_LIMIT_STORAGE_OPTIONS = {"socket_keepalive": True} if RATE_LIMIT_STORAGE_URI.startswith("redis") else {}
 LIMIT = f"{1*len(MINER_HOTKEYS)}/second" if MOCK else "1/second"
 HIGH_LIMIT = f"{5*len(MINER_HOTKEYS)}/second" if MOCK else "10/second"
 
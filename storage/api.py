@@ -8,7 +8,7 @@ from slowapi import Limiter
 
 import settings
 from orchestrator.orchestrator import orchestrator
-from utils.epistula import EpistulaHeaders, create_message_body
+from utils.epistula import EMPTY_BODY, EMPTY_BODY_HASH, EpistulaHeaders, create_message_body, get_epistula_headers
 from utils.auth import (
     AuthenticatedRequest,
     validate_authenticated_request,
@@ -31,7 +31,7 @@ from storage.serializers import (
     MultipartUploadResponse,
     CompleteMultipartUploadRequest,
 )
-from uuid import uuid4
+from utils.uuid_pool import next_uuid
 from utils.s3_interactions import (
     create_multipart_upload,
     generate_presigned_url_for_part,
@@ -42,7 +42,11 @@ from utils.shared_states import MergingPhase
 
 
 # Initialize rate limiter
-hotkey_limiter = Limiter(key_func=get_signed_by_key)
+hotkey_limiter = Limiter(
+    key_func=get_signed_by_key,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    storage_options=settings.RATE_LIMIT_STORAGE_OPTIONS,
+)
 
 
 def get_storage_instances() -> tuple[ActivationStore, WeightStore]:
@@ -67,7 +71,7 @@ async def upload_activation_to_orchestrator(
         layer=activation_request.layer,
         direction=activation_request.direction,
         miner_hotkey=auth.signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
         error = auth.headers.verify_signature_v2(create_message_body(activation_request.model_dump()), time.time())
         if error:
@@ -120,25 +124,15 @@ async def upload_activation_to_orchestrator(
 async def download_activation(
     request: Request,  # Required for rate limiting
     activation_request: ActivationDownloadRequest,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     storage_instances: tuple[ActivationStore, WeightStore] = Depends(get_storage_instances),
 ):
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
     try:
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
         error = headers.verify_signature_v2(create_message_body(activation_request.model_dump()), time.time())
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
@@ -192,14 +186,11 @@ async def download_activation(
 @hotkey_limiter.limit(settings.HIGH_LIMIT, per_method=True)
 async def get_random_activation(
     request: Request,  # Required for rate limiting
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
     """Get a random activation without exposing the full list to the miner."""
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
@@ -212,18 +203,11 @@ async def get_random_activation(
         activation_uid=None,
         layer=miner.layer,
         hotkey=signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
         orchestrator.validate_state(expected_status=MergingPhase.IS_TRAINING, hotkey=signed_by)
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
 
-        error = headers.verify_signature_v2(create_message_body({}), time.time())
+        error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
@@ -255,14 +239,11 @@ async def get_random_activation(
 @hotkey_limiter.limit(settings.LIMIT, per_method=True)
 async def get_activation_stats(
     request: Request,  # Required for rate limiting
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     storage_instances: tuple[ActivationStore, WeightStore] = Depends(get_storage_instances),
 ):
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
@@ -270,16 +251,9 @@ async def get_activation_stats(
         activation_uid=None,
         layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
         hotkey=signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
-        error = headers.verify_signature_v2(create_message_body({}), time.time())
+        error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
@@ -310,14 +284,11 @@ async def is_activation_active(
     request: Request,  # Required for rate limiting
     layer: int,
     activation_uid: str,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     storage_instances: tuple[ActivationStore, WeightStore] = Depends(get_storage_instances),
 ):
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
@@ -325,16 +296,9 @@ async def is_activation_active(
         activation_uid=None,
         layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
         hotkey=signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
-        error = headers.verify_signature_v2(create_message_body({}), time.time())
+        error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
@@ -359,14 +323,11 @@ async def is_activation_active(
 async def get_weights(
     request: Request,  # Required for rate limiting
     miner_hotkey: str,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     storage_instances: tuple[ActivationStore, WeightStore] = Depends(get_storage_instances),
 ):
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
@@ -374,16 +335,9 @@ async def get_weights(
         activation_uid=None,
         layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
         hotkey=signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
-        error = headers.verify_signature_v2(create_message_body({}), time.time())
+        error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
@@ -411,14 +365,11 @@ async def get_weights(
 @hotkey_limiter.limit(settings.LIMIT, per_method=True)
 async def list_miners(
     request: Request,  # Required for rate limiting
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     storage_instances: tuple[ActivationStore, WeightStore] = Depends(get_storage_instances),
 ):
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
@@ -426,16 +377,9 @@ async def list_miners(
         activation_uid=None,
         layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
         hotkey=signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
-        error = headers.verify_signature_v2(create_message_body({}), time.time())
+        error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
@@ -471,10 +415,10 @@ async def delete_weights(
         activation_uid=None,
         layer=orchestrator.miner_registry.get_miner_data(auth.signed_by).layer,
         hotkey=auth.signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
         validator_hotkey = auth.signed_by
-        error = auth.headers.verify_signature_v2(create_message_body({}), time.time())
+        error = auth.headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
@@ -510,7 +454,7 @@ async def set_layer_weights(
         activation_uid=None,
         layer=orchestrator.miner_registry.get_miner_data(auth.signed_by).layer,
         hotkey=auth.signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
         error = auth.headers.verify_signature_v2(create_message_body(weight_request.model_dump()), time.time())
         if error:
@@ -542,14 +486,11 @@ async def set_layer_weights(
 async def get_layer_weights(
     request: Request,  # Required for rate limiting
     layer: int,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
     storage_instances: tuple[ActivationStore, WeightStore] = Depends(get_storage_instances),
 ) -> list[Partition]:
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
@@ -557,17 +498,10 @@ async def get_layer_weights(
         activation_uid=None,
         layer=layer,
         hotkey=signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
         try:
-            headers = EpistulaHeaders(
-                version=version,
-                timestamp=timestamp,
-                uuid=uuid,
-                signed_by=signed_by,
-                request_signature=request_signature,
-            )
-            error = headers.verify_signature_v2(create_message_body({}), time.time())
+            error = headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH)
             if error:
                 raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
 
@@ -599,12 +533,8 @@ async def get_layer_weights(
 async def get_presigned_url(
     request: Request,  # Required for rate limiting
     data: PresignedUrlRequest,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
     """Generate a presigned URL for S3 operations.
 
@@ -616,6 +546,7 @@ async def get_presigned_url(
     Returns:
         PresignedUrlResponse containing the URL and any additional fields
     """
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
@@ -623,15 +554,8 @@ async def get_presigned_url(
         activation_uid=None,
         layer=orchestrator.miner_registry.get_miner_data(signed_by).layer,
         hotkey=signed_by,
-        request_id=str(uuid4()),
+        request_id=next_uuid(),
     ):
-        headers = EpistulaHeaders(
-            version=version,
-            timestamp=timestamp,
-            uuid=uuid,
-            signed_by=signed_by,
-            request_signature=request_signature,
-        )
         error = headers.verify_signature_v2(create_message_body(data.model_dump()), time.time())
         if error:
             raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
@@ -673,24 +597,14 @@ async def get_presigned_url(
 async def initiate_multipart_upload(
     request: Request,  # Required for rate limiting
     upload_request: MultipartUploadRequest,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
     """Initiate a multipart upload and return presigned URLs for parts."""
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
-    headers = EpistulaHeaders(
-        version=version,
-        timestamp=timestamp,
-        uuid=uuid,
-        signed_by=signed_by,
-        request_signature=request_signature,
-    )
     error = headers.verify_signature_v2(create_message_body(upload_request.model_dump()), time.time())
     if error:
         raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
@@ -773,24 +687,14 @@ async def initiate_multipart_upload(
 async def complete_multipart_upload_endpoint(
     request: Request,  # Required for rate limiting
     complete_request: CompleteMultipartUploadRequest,
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ):
     """Complete a multipart upload."""
+    signed_by = headers.signed_by
     # Validate orchestrator version
     validate_orchestrator_time(orchestrator_time, orchestrator.orchestrator_time)
 
-    headers = EpistulaHeaders(
-        version=version,
-        timestamp=timestamp,
-        uuid=uuid,
-        signed_by=signed_by,
-        request_signature=request_signature,
-    )
     error = headers.verify_signature_v2(create_message_body(complete_request.model_dump()), time.time())
     if error:
         raise HTTPException(status_code=401, detail=f"Epistula verification failed: {error}")
@@ -0,0 +1,59 @@
+import sys
+import os
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import bt_utils
+from utils.bt_utils import get_hotkey_uids, verify_entity_type
+
+
+@pytest.fixture(autouse=True)
+def clear_hotkey_uids(monkeypatch):
+    monkeypatch.setattr(bt_utils, "_hotkey_uids", None)
+
+
+def make_metagraph(hotkeys: list[str], block: int = 100) -> SimpleNamespace:
+    return SimpleNamespace(hotkeys=hotkeys, block=block)
+
+
+def test_get_hotkey_uids_reuses_mapping_between_syncs():
+    metagraph = make_metagraph(["a", "b", "c"])
+
+    uids = get_hotkey_uids(metagraph)
+    assert uids == {"a": 0, "b": 1, "c": 2}
+    assert get_hotkey_uids(metagraph) is uids
+
+
+def test_get_hotkey_uids_rebuilds_after_resync():
+    metagraph = make_metagraph(["a", "b", "c"])
+    assert get_hotkey_uids(metagraph)["c"] == 2
+
+    # A sync at a later block deregisters "c" and puts "d" in its uid
+    metagraph.hotkeys = ["a", "b", "d"]
+    metagraph.block = 101
+    assert get_hotkey_uids(metagraph) == {"a": 0, "b": 1, "d": 2}
+
+    # A resync that lands on the same block still replaces the hotkeys list
+    metagraph.hotkeys = ["a", "e", "d"]
+    assert get_hotkey_uids(metagraph) == {"a": 0, "e": 1, "d": 2}
+
+
+def test_get_hotkey_uids_rebuilds_after_metagraph_swap():
+    assert get_hotkey_uids(make_metagraph(["a", "b", "c"])) == {"a": 0, "b": 1, "c": 2}
+
+    # Same block and size, but a different metagraph object
+    assert get_hotkey_uids(make_metagraph(["x", "y", "z"])) == {"x": 0, "y": 1, "z": 2}
+
+
+def test_verify_entity_type_rejects_unregistered_hotkey():
+    metagraph = make_metagraph(["a", "b", "c"])
+
+    assert "unknown" not in get_hotkey_uids(metagraph)
+    with pytest.raises(HTTPException) as exc_info:
+        verify_entity_type(signed_by="unknown", metagraph=metagraph)
+    assert exc_info.value.status_code == 403
@@ -0,0 +1,116 @@
+import sys
+import os
+import time
+
+import pytest
+from fastapi import HTTPException, Request
+from pydantic import ValidationError
+from substrateinterface import Keypair
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import epistula
+from utils.epistula import (
+    EMPTY_BODY,
+    EMPTY_BODY_HASH,
+    EpistulaHeaders,
+    SignatureCache,
+    create_message_body,
+    generate_header,
+    get_epistula_headers,
+)
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+@pytest.fixture
+def keypair():
+    return Keypair.create_from_uri("//Alice")
+
+
+@pytest.fixture(autouse=True)
+def clear_signature_cache():
+    epistula.signature_cache.clear()
+    yield
+    epistula.signature_cache.clear()
+
+
+def make_headers(keypair: Keypair, body: bytes) -> EpistulaHeaders:
+    header = generate_header(keypair, body)
+    return EpistulaHeaders.model_construct(
+        version=header["Epistula-Version"],
+        timestamp=header["Epistula-Timestamp"],
+        uuid=header["Epistula-Uuid"],
+        signed_by=header["Epistula-Signed-By"],
+        request_signature=header["Epistula-Request-Signature"],
+    )
+
+
+def test_verify_signature_v2(keypair):
+    body = create_message_body({"loss_value": 1.5, "activation_uid": "abc"})
+    headers = make_headers(keypair, body)
+
+    assert headers.verify_signature_v2(body, time.time()) is None
+    assert headers.verify_signature_v2(create_message_body({"loss_value": 2.0}), time.time()) == "Signature Mismatch"
+
+
+def test_verify_signature_v2_prehashed_empty_body(keypair):
+    headers = make_headers(keypair, create_message_body({}))
+
+    assert headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH) is None
+
+
+def test_verify_signature_v2_uses_cache(keypair, monkeypatch):
+    body = create_message_body({})
+    headers = make_headers(keypair, body)
+
+    calls = []
+    original_verify = Keypair.verify
+
+    def counting_verify(self, data, signature):
+        calls.append(data)
+        return original_verify(self, data, signature)
+
+    monkeypatch.setattr(Keypair, "verify", counting_verify)
+
+    assert headers.verify_signature_v2(body, time.time()) is None
+    assert headers.verify_signature_v2(body, time.time()) is None
+    assert len(calls) == 1
+
+
+def test_signature_cache_expiry_and_eviction(monkeypatch):
+    cache = SignatureCache(maxsize=2, ttl=10)
+    now = 1000.0
+    monkeypatch.setattr(epistula.time, "monotonic", lambda: now)
+
+    cache.put(("a", "m", "s"), True)
+    cache.put(("b", "m", "s"), False)
+    assert cache.get(("a", "m", "s")) is True
+    assert cache.get(("b", "m", "s")) is False
+
+    # "a" was used more recently than "b", so "b" is evicted first
+    cache.get(("a", "m", "s"))
+    cache.put(("c", "m", "s"), True)
+    assert cache.get(("b", "m", "s")) is None
+    assert cache.get(("a", "m", "s")) is True
+
+    now = 1011.0
+    assert cache.get(("a", "m", "s")) is None
+
+
+@pytest.mark.asyncio
+async def test_get_epistula_headers(keypair):
+    header = generate_header(keypair, create_message_body({}))
+    raw_headers = [(name.lower().encode(), str(value).encode()) for name, value in header.items()]
+    request = Request({"type": "http", "headers": raw_headers})
+
+    headers = await get_epistula_headers(request)
+    assert headers.signed_by == keypair.ss58_address
+    assert headers.verify_signature_v2(EMPTY_BODY, time.time(), body_hash=EMPTY_BODY_HASH) is None
+    with pytest.raises(ValidationError):
+        headers.signed_by = "someone else"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_epistula_headers(Request({"type": "http", "headers": raw_headers[1:]}))
+    assert exc_info.value.status_code == 422
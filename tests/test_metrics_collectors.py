@@ -0,0 +1,66 @@
+import sys
+import os
+import time
+
+import pytest
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orchestrator.metrics_collectors import WeightMergingMetricsCollector, WeightMergingSession
+
+
+@pytest.fixture
+def collector() -> WeightMergingMetricsCollector:
+    now = time.time()
+    sessions = []
+    for i, (layer, age, status) in enumerate(
+        [
+            (0, 10, "completed"),
+            (1, 20, "completed"),
+            (0, 30, "failed"),
+            (2, 40, "completed"),
+            (1, 7200, "completed"),
+            (0, 9000, "failed"),
+        ]
+    ):
+        started_at = now - age
+        sessions.append(
+            WeightMergingSession(
+                session_id=f"merge_{layer}_{i}",
+                layer=layer,
+                started_at=started_at,
+                completed_at=started_at + 5 + i if status == "completed" else None,
+                target_miners=["a", "b", "c", "d"][: 2 + i % 3],
+                weights_received={"a": started_at + 1, "b": started_at + 2 + i},
+                partitions_completed={"a": started_at + 3 + i} if i % 2 else {},
+                status=status,
+            )
+        )
+    return WeightMergingMetricsCollector(completed_sessions=sessions)
+
+
+def test_get_recent_sessions_limit(collector):
+    recent = collector.get_recent_sessions(limit=2)
+    assert [s["session_id"] for s in recent] == ["merge_1_4", "merge_0_5"]
+    assert recent[0]["target_miners_count"] == 3
+    assert recent[0]["weights_received_count"] == 2
+
+    assert len(collector.get_recent_sessions()) == 6
+    assert collector.get_recent_sessions(limit=0) == []
+    assert collector.get_recent_sessions(limit=-1) == []
+
+
+@pytest.mark.parametrize("time_window_seconds", [None, 3600])
+def test_merge_statistics_all_layers_matches_per_layer(collector, time_window_seconds):
+    all_layers = collector.get_merge_statistics_all_layers(time_window_seconds=time_window_seconds)
+
+    for layer in [None, 0, 1, 2]:
+        expected = collector.get_merge_statistics(layer=layer, time_window_seconds=time_window_seconds)
+        assert expected
+        assert all_layers[layer] == expected
+
+    # Layers without sessions in the window are omitted, where get_merge_statistics returns {}
+    assert 3 not in all_layers
+    assert collector.get_merge_statistics(layer=3, time_window_seconds=time_window_seconds) == {}
+    assert set(all_layers) == {None, 0, 1, 2}
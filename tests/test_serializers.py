@@ -0,0 +1,40 @@
+import json
+import sys
+import os
+
+import pytest
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orchestrator.serializers import LossReportResponse, dump_loss_report_response
+
+
+def test_loss_report_response_template_covers_model_fields():
+    template_fields = list(json.loads(dump_loss_report_response("hotkey", "uid", 1.0, 2.0)))
+    assert template_fields == list(LossReportResponse.model_fields)
+
+
+def test_loss_report_response_template_matches_model_bytes():
+    kwargs = dict(hotkey="5GrwvaEF", activation_uid="abc-123", loss_value=2.3456, timestamp=1760000000.123456)
+
+    assert dump_loss_report_response(**kwargs) == LossReportResponse(**kwargs).model_dump_json().encode()
+
+
+@pytest.mark.parametrize(
+    "hotkey, activation_uid, loss_value, timestamp",
+    [
+        ('quote " and backslash \\', "line\nbreak\ttab", 0.5, 1.0),
+        ("unicode é ✓  ", "control \x00\x1f", -0.0, 0.0),
+        ("key", "uid", 1e300, 1e-300),
+        ("key", "uid", 5e-324, 1.7976931348623157e308),
+        ("key", "uid", float("inf"), float("nan")),
+    ],
+)
+def test_loss_report_response_template_matches_model_json(hotkey, activation_uid, loss_value, timestamp):
+    # Float exponents can be spelled differently (orjson writes 1e300, pydantic 1e+300), so compare decoded JSON
+    expected = LossReportResponse(
+        hotkey=hotkey, activation_uid=activation_uid, loss_value=loss_value, timestamp=timestamp
+    ).model_dump_json()
+
+    assert json.loads(dump_loss_report_response(hotkey, activation_uid, loss_value, timestamp)) == json.loads(expected)
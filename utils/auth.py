@@ -3,7 +3,7 @@
 import settings
 from typing import Annotated
 from fastapi import HTTPException, Header, Depends, Request
-from utils.epistula import EpistulaHeaders
+from utils.epistula import EpistulaHeaders, get_epistula_headers
 from utils.bt_utils import verify_entity_type
 from orchestrator.orchestrator import orchestrator
 from slowapi.util import get_remote_address
@@ -18,13 +18,9 @@ class AuthenticatedRequest:
 
 
 async def validate_authenticated_request(
-    version: Annotated[str, Header(alias="Epistula-Version")],
-    timestamp: Annotated[str, Header(alias="Epistula-Timestamp")],
-    uuid: Annotated[str, Header(alias="Epistula-Uuid")],
-    signed_by: Annotated[str, Header(alias="Epistula-Signed-By")],
-    request_signature: Annotated[str, Header(alias="Epistula-Request-Signature")],
     orchestrator_time: Annotated[str, Header(alias="X-Orchestrator-Version")],
     spec_version: Annotated[str, Header(alias="X-Spec-Version")],
+    headers: EpistulaHeaders = Depends(get_epistula_headers),
 ) -> AuthenticatedRequest:
     """Dependency that validates Epistula headers and orchestrator version."""
     # Validate orchestrator version
@@ -41,16 +37,7 @@ async def validate_authenticated_request(
             detail=f"Spec version mismatch. Expected: {settings.__spec_version__}, Received: {spec_version}",
         )
 
-    # Create and return headers object
-    headers = EpistulaHeaders(
-        version=version,
-        timestamp=timestamp,
-        uuid=uuid,
-        signed_by=signed_by,
-        request_signature=request_signature,
-    )
-
-    return AuthenticatedRequest(signed_by=signed_by, headers=headers)
+    return AuthenticatedRequest(signed_by=headers.signed_by, headers=headers)
 
 
 async def validate_miner_request(
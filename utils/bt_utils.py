@@ -95,6 +95,26 @@ def run_in_thread(func: functools.partial, ttl: int, name=None) -> Any:
         bt.logging.trace(f"{name} cleaned up successfully")
 
 
+# (metagraph, hotkeys list, (block, size), {hotkey: uid}) for the most recently seen metagraph. The metagraph
+# and its hotkeys list are held by reference, so their identities can't be reused by new objects while cached.
+_hotkey_uids: tuple[bt.metagraph, list[str], tuple[int, int], dict[str, int]] | None = None
+
+
+def get_hotkey_uids(metagraph: bt.metagraph) -> dict[str, int]:
+    """Map each hotkey in the metagraph to its uid.
+
+    The mapping is rebuilt when a different metagraph is passed, or when the metagraph has been resynced:
+    a sync replaces its hotkeys list and advances its block. Between syncs, lookups are O(1) dict hits.
+    """
+    global _hotkey_uids
+    hotkeys = metagraph.hotkeys
+    version = (int(metagraph.block), len(hotkeys))
+    cached = _hotkey_uids
+    if cached is None or cached[0] is not metagraph or cached[1] is not hotkeys or cached[2] != version:
+        cached = _hotkey_uids = (metagraph, hotkeys, version, {hotkey: uid for uid, hotkey in enumerate(hotkeys)})
+    return cached[3]
+
+
 def verify_entity_type(
     signed_by: str,
     metagraph: bt.metagraph,
@@ -116,13 +136,11 @@ def verify_entity_type(
     Raises:
         HTTPException: If verification fails
     """
-    # Check if hotkey is registered
-    if signed_by not in metagraph.hotkeys:
+    # Check if hotkey is registered and get its UID
+    uid = get_hotkey_uids(metagraph).get(signed_by)
+    if uid is None:
         raise HTTPException(status_code=403, detail=f"Hotkey {signed_by} not registered on subnet")
 
-    # Get UID
-    uid = metagraph.hotkeys.index(signed_by)
-
     # Check entity type
     is_validator_entity = is_validator(uid, metagraph, vpermit_rao_limit)
     is_miner_entity = is_miner(uid, metagraph, vpermit_rao_limit)
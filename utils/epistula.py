@@ -1,27 +1,97 @@
-import json
+import functools
+import threading
 import time
+from collections import OrderedDict
 from hashlib import sha256
 from math import ceil
 import traceback
 from typing import Annotated, Any, Optional
-from uuid import uuid4
 
-from fastapi import Header
+from fastapi import Header, HTTPException, Request
+import orjson
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from substrateinterface import Keypair
 
-from settings import SIGNATURE_TIMEOUT_MS
+from settings import (
+    SIGNATURE_CACHE_SIZE,
+    SIGNATURE_CACHE_TTL,
+    SIGNATURE_TIMEOUT_MS,
+)
+from utils.uuid_pool import next_uuid
+
+
+class SignatureCache:
+    """LRU cache of recent signature verification results.
+
+    Entries are keyed by (signed_by, message, signature); the message already embeds the body hash,
+    uuid and timestamp, so a hit means the exact same signed request was verified before. Entries
+    older than `ttl` seconds are treated as misses.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str, str]) -> Optional[bool]:
+        """Return the cached verification result, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            verified_at, verified = entry
+            if time.monotonic() - verified_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return verified
+
+    def put(self, key: tuple[str, str, str], verified: bool) -> None:
+        """Store a verification result, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), verified)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+signature_cache = SignatureCache(maxsize=SIGNATURE_CACHE_SIZE, ttl=SIGNATURE_CACHE_TTL)
+
+
+@functools.lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+def get_keypair(ss58_address: str) -> Keypair:
+    """Decode (and cache) the public keypair for a signer so repeat senders skip the ss58 decode."""
+    return Keypair(ss58_address=ss58_address)
+
+
+def verify_signature_cached(signed_by: str, message: str, signature: str) -> bool:
+    """Verify `signature` over `message` for `signed_by`, skipping the curve math for repeats."""
+    key = (signed_by, message, signature)
+    verified = signature_cache.get(key)
+    if verified is None:
+        verified = get_keypair(signed_by).verify(message, signature)
+        signature_cache.put(key, verified)
+    return verified
 
 
 class EpistulaHeaders(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     version: str = Header(..., alias="Epistula-Version")
     timestamp: str = Header(default=str(time.time()), alias="Epistula-Timestamp")
     uuid: str = Header(..., alias="Epistula-Uuid")
     signed_by: str = Header(..., alias="Epistula-Signed-By")
     request_signature: str = Header(..., alias="Epistula-Request-Signature")
 
-    def verify_signature_v2(self, body: bytes, now: float) -> Optional[Annotated[str, "Error Message"]]:
+    def verify_signature_v2(
+        self, body: bytes, now: float, body_hash: Optional[str] = None
+    ) -> Optional[Annotated[str, "Error Message"]]:
         try:
             if not isinstance(self.request_signature, str):
                 raise ValueError("Invalid Signature")
@@ -39,14 +109,17 @@ class EpistulaHeaders(BaseModel):
             if not isinstance(body, bytes):
                 raise ValueError("Body is not of type bytes")
 
-            keypair = Keypair(ss58_address=self.signed_by)
-
             if timestamp + SIGNATURE_TIMEOUT_MS < now:
                 raise ValueError("Request is too stale")
 
-            message = f"{sha256(body).hexdigest()}.{self.uuid}.{self.timestamp}."
+            # Callers verifying a constant body (EMPTY_BODY) pass its precomputed hash
+            if body_hash is None:
+                body_hash = sha256(body).hexdigest()
+
+            message = f"{body_hash}.{self.uuid}.{self.timestamp}."
 
-            verified = keypair.verify(message, self.request_signature)
+            # Freshness is checked above on every call; only the signature check itself is cached
+            verified = verify_signature_cached(self.signed_by, message, self.request_signature)
             if not verified:
                 raise ValueError("Signature Mismatch")
 
@@ -57,6 +130,32 @@ class EpistulaHeaders(BaseModel):
             return str(e)
 
 
+# Raw ASGI header names (lowercase bytes) of the Epistula headers, mapped to their EpistulaHeaders fields
+EPISTULA_HEADER_FIELDS: dict[bytes, str] = {
+    b"epistula-version": "version",
+    b"epistula-timestamp": "timestamp",
+    b"epistula-uuid": "uuid",
+    b"epistula-signed-by": "signed_by",
+    b"epistula-request-signature": "request_signature",
+}
+
+
+async def get_epistula_headers(request: Request) -> EpistulaHeaders:
+    """Dependency that reads all Epistula headers from the raw ASGI headers in a single pass."""
+    values: dict[str, str] = {}
+    for name, value in request.scope["headers"]:
+        field = EPISTULA_HEADER_FIELDS.get(name)
+        if field is not None and field not in values:
+            values[field] = value.decode("latin-1")
+
+    if len(values) != len(EPISTULA_HEADER_FIELDS):
+        missing = [name.decode() for name, field in EPISTULA_HEADER_FIELDS.items() if field not in values]
+        raise HTTPException(status_code=422, detail=f"Missing required headers: {', '.join(missing)}")
+
+    # Every field is present and already a str, so pydantic validation is skipped
+    return EpistulaHeaders.model_construct(**values)
+
+
 def generate_header(
     hotkey: Keypair,
     body: bytes,
@@ -75,7 +174,7 @@ def generate_header(
     """
     timestamp = round(time.time() * 1000)
     timestampInterval = ceil(timestamp / 1e4) * 1e4
-    uuid = str(uuid4())
+    uuid = next_uuid()
 
     # Create message for signing with optional signed_for
     message = f"{sha256(body).hexdigest()}.{uuid}.{timestamp}.{signed_for or ''}"
@@ -101,4 +200,9 @@ def generate_header(
 
 def create_message_body(data: dict) -> bytes:
     """Utility method to create message body from dictionary data"""
-    return json.dumps(data, default=str, sort_keys=True).encode("utf-8")
+    return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+# Several endpoints sign an empty body, so its serialization and hash are computed once at import
+EMPTY_BODY = create_message_body({})
+EMPTY_BODY_HASH = sha256(EMPTY_BODY).hexdigest()
@@ -1,5 +1,5 @@
 from typing import Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from loguru import logger
 import random
 from itertools import combinations
@@ -45,6 +45,10 @@ class Partition(BaseModel):
         )
 
 
+# Dumps a whole list of partitions in one pydantic-core call instead of a model_dump() per partition
+PARTITION_LIST_ADAPTER = TypeAdapter(list[Partition])
+
+
 class PartitionManager(BaseModel):
     """Class for managing partitions for a given layer.
 
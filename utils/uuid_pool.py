@@ -0,0 +1,26 @@
+"""Random UUID4s generated in bulk from a single os.urandom read per batch."""
+
+import os
+import uuid
+from collections import deque
+
+UUID_POOL_SIZE = 4096
+
+_uuid_pool: deque[str] = deque()
+
+# A forked child must not hand out the same UUIDs as its parent
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _refill_uuid_pool():
+    raw = os.urandom(16 * UUID_POOL_SIZE)
+    _uuid_pool.extend(str(uuid.UUID(bytes=raw[i : i + 16], version=4)) for i in range(0, len(raw), 16))
+
+
+def next_uuid() -> str:
+    """Return a random UUID4 string, equivalent to str(uuid.uuid4())."""
+    while True:
+        try:
+            return _uuid_pool.popleft()
+        except IndexError:
+            _refill_uuid_pool()